@@ -1,9 +1,16 @@
 """폰트 정보 표시 위젯"""
 
-from fontTools.ttLib import TTFont
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget
 
+# PyInstaller에서도 작동하는 안전한 import
+try:
+    # 상대 import 시도
+    from .font_merger import load_font
+except (ImportError, ValueError):
+    # 절대 import 시도 (PyInstaller 환경)
+    from font_merge.font_merger import load_font
+
 
 class FontInfo(QWidget):
     """폰트의 기본 정보를 표시하는 위젯"""
@@ -54,7 +61,7 @@ class FontInfo(QWidget):
         self._current_font_path = font_path
 
         try:
-            font = TTFont(font_path)
+            font = load_font(font_path)
 
             # 폰트 이름 추출
             font_name = self._get_font_name(font)
@@ -214,8 +221,8 @@ class FontInfo(QWidget):
             return ""
 
         try:
-            font1 = TTFont(self._current_font_path)
-            font2 = TTFont(other_font_path)
+            font1 = load_font(self._current_font_path)
+            font2 = load_font(other_font_path)
 
             warnings = []
 
@@ -1,11 +1,16 @@
 """폰트 병합 로직"""
 
+import collections
+import functools
+import io
+import mmap
 import os
-import tempfile
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from fontTools.merge import Merger
-from fontTools.subset import Subsetter
-from fontTools.ttLib import TTFont
+from fontTools.ttLib import TTFont, newTable
+from fontTools.ttLib.sfnt import SFNTReader
 
 try:
     # WOFF2 지원 테스트를 위해 import 시도
@@ -15,13 +20,313 @@ except ImportError:
     WOFF2_AVAILABLE = False
     print("경고: WOFF2 압축 기능을 사용할 수 없습니다. brotli 패키지를 설치하세요.")
 
+try:
+    # HarfBuzz 서브셋(hb-subset) 사용을 위해 import 시도 (선택 의존성)
+    import uharfbuzz as hb
+
+    HARFBUZZ_AVAILABLE = True
+except ImportError:
+    HARFBUZZ_AVAILABLE = False
+
+# OS/2 ulUnicodeRange1 한글 비트
+# Bit 28: Hangul Jamo (U+1100-U+11FF)
+# Bit 29: Hangul Syllables (U+AC00-U+D7AF)
+# Bit 30: Hangul Compatibility Jamo (U+3130-U+318F)
+_OS2_KOREAN_URANGE1 = (1 << 28) | (1 << 29) | (1 << 30)
+
+# OS/2 ulCodePageRange1 한국어 비트
+# Bit 19: Korean (Wansung) - 949
+_OS2_KOREAN_CPRANGE1 = 1 << 19
+
+# 폰트 이름을 기록할 플랫폼 (platformID, platEncID, langID)
+_NAME_PLATFORMS = (
+    (3, 1, 0x409),  # Windows, Unicode BMP, English US
+    (1, 0, 0),  # Macintosh, Roman, English
+)
+
+# 폰트 파일 시그니처 (TrueType, OpenType CFF, Apple TrueType, Type 1,
+# TrueType Collection, WOFF, WOFF2)
+_SFNT_SIGNATURES = (
+    b"\x00\x01\x00\x00",
+    b"OTTO",
+    b"true",
+    b"typ1",
+    b"ttcf",
+    b"wOFF",
+    b"wOF2",
+)
+
+# 압축되지 않은 단일 sfnt 시그니처 (테이블 디렉터리를 직접 읽을 수 있는 형식)
+_PLAIN_SFNT_SIGNATURES = _SFNT_SIGNATURES[:3]
+
+# 폰트 이름 조회 순서 (Family name, Full font name)
+_FONT_NAME_IDS = (1, 4)
+
+# 폰트 이름 레코드 플랫폼 우선순위 (Windows Unicode, Mac Roman)
+_FONT_NAME_PLATFORMS = ((3, 1), (1, 0))
+
+# 캐시에 유지할 TTFont 수 (각각 원본 파일을 메모리 매핑하고 있음)
+_FONT_CACHE_SIZE = 8
+
+# (경로, 수정 시각, 크기) -> 캐시된 TTFont (오래 쓰지 않은 것부터 제거)
+_font_cache = collections.OrderedDict()
+_font_cache_lock = threading.Lock()
+
+
+def _sniff_sfnt(font_path):
+    """파일 앞 4바이트만 읽어 폰트 파일 시그니처인지 확인"""
+    with open(font_path, "rb") as f:
+        return f.read(4) in _SFNT_SIGNATURES
+
+
+def _open_mmap(font_path):
+    """폰트 파일을 읽기 전용으로 메모리 매핑 (실제로 접근한 페이지만 읽힘)"""
+    with open(font_path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _load_font_cached(font_path, mtime, size):
+    """
+    (경로, 수정 시각, 크기)별로 파싱된 TTFont 캐시 (테이블은 접근 시 로드)
+
+    캐시에서 빠지는 TTFont는 닫아서 메모리 매핑을 바로 해제한다
+    """
+    key = (font_path, mtime, size)
+    with _font_cache_lock:
+        font = _font_cache.get(key)
+        if font is not None:
+            _font_cache.move_to_end(key)
+            return font
+
+        font = TTFont(_open_mmap(font_path), lazy=True)
+
+        # 같은 경로의 이전 버전은 다시 쓰이지 않으므로 먼저 해제
+        for old_key in [k for k in _font_cache if k[0] == font_path]:
+            _font_cache.pop(old_key).close()
+
+        _font_cache[key] = font
+        if len(_font_cache) > _FONT_CACHE_SIZE:
+            _font_cache.popitem(last=False)[1].close()
+        return font
+
+
+def _release_cached_font(font_path):
+    """
+    경로에 해당하는 캐시된 TTFont를 닫아 메모리 매핑 해제
+
+    매핑된 파일은 Windows에서 교체할 수 없으므로 덮어쓰기 전에 호출
+    """
+    with _font_cache_lock:
+        for key in [k for k in _font_cache if k[0] == font_path]:
+            _font_cache.pop(key).close()
+
+
+@functools.lru_cache(maxsize=8)
+def _cmap_set_cached(font_path, mtime, size):
+    """
+    (경로, 수정 시각, 크기)별로 폰트가 지원하는 코드포인트 집합 캐시
+
+    워커 스레드에서도 호출되므로 공유 TTFont 대신 별도로 매핑해서 읽는다
+    """
+    with TTFont(_open_mmap(font_path), lazy=True) as font:
+        return frozenset(font.getBestCmap() or {})
+
+
+def _font_cache_key(font_path):
+    """캐시 키 생성 (파일이 바뀌면 키도 바뀌어 캐시가 자동 무효화됨)"""
+    stat = os.stat(font_path)
+    return font_path, stat.st_mtime_ns, stat.st_size
+
+
+def load_font(font_path):
+    """
+    캐시된 TTFont 반환 (읽기 전용으로 사용해야 함)
+
+    Args:
+        font_path: 폰트 파일 경로
+
+    Returns:
+        TTFont: 지연 로딩된 폰트 객체
+    """
+    return _load_font_cached(*_font_cache_key(font_path))
+
+
+def load_cmap_codes(font_path):
+    """
+    캐시된 코드포인트 집합 반환
+
+    Args:
+        font_path: 폰트 파일 경로
+
+    Returns:
+        frozenset: 폰트의 cmap에 있는 유니코드 코드포인트 집합
+    """
+    return _cmap_set_cached(*_font_cache_key(font_path))
+
+
+def _find_sfnt_table(data, tag):
+    """sfnt 테이블 디렉터리에서 테이블 오프셋 찾기 (없으면 None)"""
+    (num_tables,) = struct.unpack_from(">H", data, 4)
+    for i in range(num_tables):
+        record_tag, _, offset, _ = struct.unpack_from(">4sLLL", data, 12 + 16 * i)
+        if record_tag == tag:
+            return offset
+    return None
+
+
+def _read_raw_upm(data):
+    """head 테이블에서 unitsPerEm 직접 읽기"""
+    head_offset = _find_sfnt_table(data, b"head")
+    if head_offset is None:
+        return None
+    (upm,) = struct.unpack_from(">H", data, head_offset + 18)
+    return upm
+
+
+def _read_raw_font_name(data):
+    """
+    name 테이블에서 폰트 이름 직접 읽기
+
+    Windows Unicode(3, 1), Mac Roman(1, 0) 순으로 레코드를 찾으며,
+    영어 외 Mac 레코드처럼 직접 디코딩하기 어려운 경우 ValueError 발생
+    """
+    name_offset = _find_sfnt_table(data, b"name")
+    if name_offset is None:
+        return None
+
+    _, count, string_offset = struct.unpack_from(">HHH", data, name_offset)
+    storage = name_offset + string_offset
+
+    # (nameID, platformID, platEncID) -> 첫 번째 레코드 (한 번만 훑음)
+    records = {}
+    for i in range(count):
+        platform_id, enc_id, lang_id, name_id, length, offset = struct.unpack_from(
+            ">HHHHHH", data, name_offset + 6 + 12 * i
+        )
+        records.setdefault((name_id, platform_id, enc_id), (lang_id, length, offset))
+
+    for target_id in _FONT_NAME_IDS:
+        for platform_id, enc_id in _FONT_NAME_PLATFORMS:
+            record = records.get((target_id, platform_id, enc_id))
+            if record is None:
+                continue
+            lang_id, length, offset = record
+            raw = bytes(data[storage + offset : storage + offset + length])
+            if platform_id == 3:
+                return raw.decode("utf-16-be")
+            if lang_id != 0:
+                raise ValueError("지원하지 않는 Mac 이름 레코드 인코딩")
+            return raw.decode("mac_roman")
+    return None
+
+
+def _read_raw_sfnt(font_path, reader):
+    """
+    TTFont 없이 sfnt 바이트에서 직접 값 읽기
+
+    압축되지 않은 sfnt가 아니거나 파싱에 실패하면 ValueError 발생
+    """
+    with open(font_path, "rb") as f:
+        if f.read(4) not in _PLAIN_SFNT_SIGNATURES:
+            raise ValueError("직접 읽을 수 없는 폰트 형식")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            try:
+                return reader(data)
+            except (struct.error, UnicodeDecodeError) as e:
+                raise ValueError(f"sfnt 파싱 실패: {str(e)}") from e
+
+
+def _read_single_table(font_path, tag):
+    """
+    SFNTReader로 테이블 하나만 읽어 디코딩 (WOFF/WOFF2 포함, 없으면 None)
+
+    공유 캐시의 TTFont를 다른 스레드에서 건드리지 않도록 별도로 연다
+    """
+    with open(font_path, "rb") as f:
+        reader = SFNTReader(f)
+        if tag not in reader:
+            return None
+        table = newTable(tag)
+        table.decompile(reader[tag], None)
+        return table
+
+
+@functools.lru_cache(maxsize=32)
+def _read_font_upm_cached(font_path, mtime, size):
+    """(경로, 수정 시각, 크기)별 unitsPerEm 캐시"""
+    try:
+        return _read_raw_sfnt(font_path, _read_raw_upm)
+    except ValueError:
+        head = _read_single_table(font_path, "head")
+        return head.unitsPerEm if head is not None else None
+
+
+@functools.lru_cache(maxsize=32)
+def _read_font_name_cached(font_path, mtime, size):
+    """(경로, 수정 시각, 크기)별 폰트 이름 캐시"""
+    try:
+        return _read_raw_sfnt(font_path, _read_raw_font_name)
+    except ValueError:
+        name_table = _read_single_table(font_path, "name")
+        if name_table is None:
+            return None
+
+        # (nameID, platformID, platEncID) -> 첫 번째 레코드
+        records = {}
+        for record in name_table.names:
+            key = (record.nameID, record.platformID, record.platEncID)
+            records.setdefault(key, record)
+
+        for target_id in _FONT_NAME_IDS:
+            for platform_id, enc_id in _FONT_NAME_PLATFORMS:
+                record = records.get((target_id, platform_id, enc_id))
+                if record is not None:
+                    return record.toUnicode()
+        return None
+
+
+def read_font_upm(font_path):
+    """
+    폰트의 unitsPerEm 반환 (head 테이블을 직접 읽고, 실패 시 SFNTReader 사용)
+
+    Args:
+        font_path: 폰트 파일 경로
+
+    Returns:
+        int: unitsPerEm 값 (head 테이블이 없으면 None)
+    """
+    return _read_font_upm_cached(*_font_cache_key(font_path))
+
+
+def read_font_name(font_path):
+    """
+    폰트 이름 반환 (Family name 우선, 없으면 Full font name)
+
+    name 테이블을 직접 읽고, 실패 시 SFNTReader 사용
+
+    Args:
+        font_path: 폰트 파일 경로
+
+    Returns:
+        str: 폰트 이름 (찾지 못하면 None)
+    """
+    return _read_font_name_cached(*_font_cache_key(font_path))
+
 
 class FontMerger:
     """두 폰트를 병합하는 클래스"""
 
     def __init__(self):
+        # fontTools.merge는 무거운 모듈이므로 병합기를 만들 때 import
+        from fontTools.merge import Merger
+
+        # 병합기는 한 번만 생성하여 모든 병합 모드에서 재사용
+        # (Merger.merge는 호출마다 내부 상태를 새로 설정하므로 재사용 가능)
         self.merger = Merger()
 
+        # OpenType 피처 보존 설정
+        self.merger.options.drop_tables = []  # 테이블 삭제 방지
+
     def determine_optimal_font_order(self, font1_path, font2_path):
         """
         합자 보존을 위한 최적의 폰트 순서 결정
@@ -35,8 +340,8 @@ class FontMerger:
             should_swap이 True면 원래 순서를 바꿔야 함
         """
         try:
-            font1 = TTFont(font1_path)
-            font2 = TTFont(font2_path)
+            font1 = TTFont(font1_path, lazy=True)
+            font2 = TTFont(font2_path, lazy=True)
 
             # 각 폰트의 합자 점수 계산
             score1 = self._calculate_ligature_score(font1)
@@ -150,61 +455,46 @@ class FontMerger:
         output_path,
         merge_option=0,
         font_name=None,
+        use_font1_whole=False,
     ):
         """
         두 폰트를 선택된 문자셋으로 병합
 
         Args:
             font1_path: 첫 번째 폰트 파일 경로
-            font1_charsets: 첫 번째 폰트에서 선택된 문자셋 딕셔너리
+            font1_charsets: 첫 번째 폰트에서 선택된 문자셋
+                (문자셋 이름 -> 유니코드 코드포인트 frozenset)
             font2_path: 두 번째 폰트 파일 경로
-            font2_charsets: 두 번째 폰트에서 선택된 문자셋 딕셔너리
+            font2_charsets: 두 번째 폰트에서 선택된 문자셋
+                (문자셋 이름 -> 유니코드 코드포인트 frozenset)
             output_path: 출력 폰트 파일 경로
             merge_option: 병합 옵션 (0: 기본, 1: UPM 통일, 2: 관대한 옵션)
             font_name: 사용자 정의 폰트 이름 (None이면 기본 폰트 이름 사용)
+            use_font1_whole: True면 첫 번째(기본) 폰트를 서브셋 없이 그대로 사용
 
         Returns:
             bool: 성공 여부
         """
         try:
-            # 첫 번째 폰트에서 선택된 문자들만 추출
-            font1_subset = self._create_font_subset(font1_path, font1_charsets)
-            if not font1_subset:
-                raise Exception("첫 번째 폰트에서 문자셋을 추출할 수 없습니다.")
-
-            # 두 번째 폰트에서 선택된 문자들만 추출
-            font2_subset = self._create_font_subset(font2_path, font2_charsets)
-            if not font2_subset:
-                raise Exception("두 번째 폰트에서 문자셋을 추출할 수 없습니다.")
-
-            # 임시 파일로 서브셋 저장
-            with tempfile.NamedTemporaryFile(suffix=".ttf", delete=False) as temp1:
-                font1_subset.save(temp1.name)
-                temp1_path = temp1.name
-
-            with tempfile.NamedTemporaryFile(suffix=".ttf", delete=False) as temp2:
-                font2_subset.save(temp2.name)
-                temp2_path = temp2.name
+            # 병합할 입력 준비 (선택된 문자들만 추출)
+            font1_source, font2_source = self._prepare_merge_sources(
+                font1_path, font1_charsets, font2_path, font2_charsets, use_font1_whole
+            )
 
-            try:
-                # 두 폰트 병합 (파일 경로 사용)
-                merged_font = self._merge_font_files(
-                    temp1_path, temp2_path, merge_option
-                )
+            # 두 폰트 병합
+            merged_font = self._merge_font_files(
+                font1_source, font2_source, merge_option
+            )
 
-                # 폰트 이름 설정
-                if font_name:
-                    self._update_font_name(merged_font, font_name)
+            # 폰트 이름 설정
+            if font_name:
+                self._update_font_name(merged_font, font_name)
 
-                # 합자 지원 복원 (기본 폰트 설정 보존)
-                self._restore_ligature_support(merged_font, temp1_path, temp2_path)
+            # 합자 지원 복원 (기본 폰트 설정 보존)
+            self._restore_ligature_support(merged_font, font1_source, font2_source)
 
-                # 결과 저장
-                merged_font.save(output_path)
-            finally:
-                # 임시 파일 정리
-                os.unlink(temp1_path)
-                os.unlink(temp2_path)
+            # 결과 저장
+            self._save_font_atomic(merged_font, output_path)
 
             return True
 
@@ -221,19 +511,25 @@ class FontMerger:
         merge_option=0,
         font_name=None,
         output_format="ttf",
+        use_font1_whole=False,
+        is_cancelled=None,
     ):
         """
         두 폰트를 선택된 문자셋으로 병합하고 지정된 형식으로 저장
 
         Args:
             font1_path: 첫 번째 폰트 파일 경로
-            font1_charsets: 첫 번째 폰트에서 선택된 문자셋 딕셔너리
+            font1_charsets: 첫 번째 폰트에서 선택된 문자셋
+                (문자셋 이름 -> 유니코드 코드포인트 frozenset)
             font2_path: 두 번째 폰트 파일 경로
-            font2_charsets: 두 번째 폰트에서 선택된 문자셋 딕셔너리
+            font2_charsets: 두 번째 폰트에서 선택된 문자셋
+                (문자셋 이름 -> 유니코드 코드포인트 frozenset)
             output_path: 출력 폰트 파일 경로
             merge_option: 병합 옵션 (0: 기본, 1: UPM 통일, 2: 관대한 옵션)
             font_name: 사용자 정의 폰트 이름 (None이면 기본 폰트 이름 사용)
             output_format: 출력 형식 ("ttf" 또는 "woff2")
+            use_font1_whole: True면 첫 번째(기본) 폰트를 서브셋 없이 그대로 사용
+            is_cancelled: 취소 여부를 반환하는 함수 (단계 사이마다 확인)
 
         Returns:
             bool: 성공 여부
@@ -246,53 +542,125 @@ class FontMerger:
                     "pip install brotli"
                 )
 
-            # 첫 번째 폰트에서 선택된 문자들만 추출
-            font1_subset = self._create_font_subset(font1_path, font1_charsets)
-            if not font1_subset:
-                raise Exception("첫 번째 폰트에서 문자셋을 추출할 수 없습니다.")
+            # 병합할 입력 준비 (선택된 문자들만 추출)
+            font1_source, font2_source = self._prepare_merge_sources(
+                font1_path, font1_charsets, font2_path, font2_charsets, use_font1_whole
+            )
+            self._check_cancelled(is_cancelled)
+
+            # 두 폰트 병합
+            merged_font = self._merge_font_files(
+                font1_source, font2_source, merge_option
+            )
+            self._check_cancelled(is_cancelled)
+
+            # 폰트 이름 설정
+            if font_name:
+                self._update_font_name(merged_font, font_name)
+
+            # 합자 지원 복원 (기본 폰트 설정 보존)
+            self._restore_ligature_support(merged_font, font1_source, font2_source)
+            self._check_cancelled(is_cancelled)
+
+            # 형식에 따라 저장
+            if output_format == "woff2":
+                self._save_as_woff2_via_ttf(merged_font, output_path)
+            else:
+                # TTF 형식으로 저장
+                self._save_font_atomic(merged_font, output_path)
+
+            return True
+
+        except Exception as e:
+            raise Exception(f"폰트 병합 중 오류 발생: {str(e)}") from e
+
+    def _check_cancelled(self, is_cancelled):
+        """취소 요청이 있으면 예외 발생 (저장 전 단계 사이에서 호출)"""
+        if is_cancelled and is_cancelled():
+            raise Exception("병합이 취소되었습니다")
+
+    def _prepare_merge_sources(
+        self, font1_path, font1_charsets, font2_path, font2_charsets, use_font1_whole
+    ):
+        """
+        병합에 사용할 두 폰트 입력 준비
+
+        Args:
+            font1_path: 첫 번째 폰트 파일 경로
+            font1_charsets: 첫 번째 폰트에서 선택된 문자셋
+            font2_path: 두 번째 폰트 파일 경로
+            font2_charsets: 두 번째 폰트에서 선택된 문자셋
+            use_font1_whole: True면 첫 번째 폰트는 서브셋 없이 원본 경로 사용
 
-            # 두 번째 폰트에서 선택된 문자들만 추출
+        Returns:
+            tuple: (font1_source, font2_source) 파일 경로 또는 메모리 버퍼
+        """
+        if use_font1_whole:
+            # 기본 폰트는 그대로 사용하고 두 번째 폰트만 서브셋
             font2_subset = self._create_font_subset(font2_path, font2_charsets)
             if not font2_subset:
                 raise Exception("두 번째 폰트에서 문자셋을 추출할 수 없습니다.")
+            with font2_subset:
+                return font1_path, self._save_to_buffer(font2_subset)
 
-            # 임시 파일로 서브셋 저장
-            with tempfile.NamedTemporaryFile(suffix=".ttf", delete=False) as temp1:
-                font1_subset.save(temp1.name)
-                temp1_path = temp1.name
-
-            with tempfile.NamedTemporaryFile(suffix=".ttf", delete=False) as temp2:
-                font2_subset.save(temp2.name)
-                temp2_path = temp2.name
-
-            try:
-                # 두 폰트 병합 (파일 경로 사용)
-                merged_font = self._merge_font_files(
-                    temp1_path, temp2_path, merge_option
-                )
+        # 두 폰트에서 선택된 문자들만 추출 (서로 독립적이므로 병렬 수행)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future1 = executor.submit(
+                self._create_font_subset, font1_path, font1_charsets
+            )
+            future2 = executor.submit(
+                self._create_font_subset, font2_path, font2_charsets
+            )
+            font1_subset = future1.result()
+            font2_subset = future2.result()
+
+        if not font1_subset:
+            raise Exception("첫 번째 폰트에서 문자셋을 추출할 수 없습니다.")
+        if not font2_subset:
+            raise Exception("두 번째 폰트에서 문자셋을 추출할 수 없습니다.")
+
+        # 서브셋을 메모리 버퍼로 저장한 뒤 원본 매핑 해제 (임시 파일 사용 안 함)
+        with font1_subset, font2_subset:
+            return (
+                self._save_to_buffer(font1_subset),
+                self._save_to_buffer(font2_subset),
+            )
 
-                # 폰트 이름 설정
-                if font_name:
-                    self._update_font_name(merged_font, font_name)
+    def _save_to_buffer(self, font):
+        """
+        폰트를 메모리 버퍼에 저장 (fontTools는 파일 객체도 경로처럼 읽을 수 있음)
 
-                # 합자 지원 복원 (기본 폰트 설정 보존)
-                self._restore_ligature_support(merged_font, temp1_path, temp2_path)
+        Args:
+            font: TTFont 객체
 
-                # 형식에 따라 저장
-                if output_format == "woff2":
-                    self._save_as_woff2_via_ttf(merged_font, output_path)
-                else:
-                    # TTF 형식으로 저장
-                    merged_font.save(output_path)
-            finally:
-                # 임시 파일 정리
-                os.unlink(temp1_path)
-                os.unlink(temp2_path)
+        Returns:
+            io.BytesIO: 폰트 데이터가 담긴 버퍼
+        """
+        buffer = io.BytesIO()
+        font.save(buffer)
+        buffer.seek(0)
+        return buffer
 
-            return True
+    def _save_font_atomic(self, font, output_path):
+        """
+        임시 파일에 먼저 저장한 뒤 교체하여 저장 도중 실패해도
+        손상된 출력 파일이 남지 않도록 저장
 
-        except Exception as e:
-            raise Exception(f"폰트 병합 중 오류 발생: {str(e)}") from e
+        Args:
+            font: TTFont 객체
+            output_path: 출력 파일 경로
+        """
+        temp_path = f"{output_path}.tmp"
+        try:
+            with open(temp_path, "wb", buffering=1024 * 1024) as f:
+                font.save(f)
+            # 출력 경로가 캐시된 폰트면 매핑을 해제해야 교체 가능 (Windows)
+            _release_cached_font(output_path)
+            os.replace(temp_path, output_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
 
     def _save_as_woff2_via_ttf(self, font, output_path):
         """
@@ -326,15 +694,16 @@ class FontMerger:
             print("2단계: TTF → WOFF2 변환 중...")
 
             # TTF 파일을 다시 로드하여 WOFF2로 변환
-            ttf_font = TTFont(temp_ttf_path)
-            ttf_font.flavor = "woff2"
-            ttf_font.save(output_path)
-            ttf_font.close()
+            # (저장 실패 시에도 파일 핸들을 닫아야 임시 파일을 지울 수 있음)
+            with TTFont(temp_ttf_path, lazy=True) as ttf_font:
+                ttf_font.flavor = "woff2"
+                self._save_font_atomic(ttf_font, output_path)
 
             print(f"✓ WOFF2 변환 완료: {output_path}")
 
             # TTF 백업 파일도 생성 (WOFF2가 인식되지 않을 경우 대안으로 사용)
             try:
+                _release_cached_font(backup_ttf_path)
                 os.rename(temp_ttf_path, backup_ttf_path)
                 print(f"✓ TTF 백업 파일 생성: {backup_ttf_path}")
                 temp_ttf_path = None  # 이미 이름이 바뀌었으므로 삭제하지 않음
@@ -436,7 +805,7 @@ class FontMerger:
                 print(f"⚠ WOFF2 파일 크기가 작습니다: {file_size} bytes")
 
             # 파일 로드 테스트
-            test_font = TTFont(file_path)
+            test_font = TTFont(file_path, lazy=True)
 
             # 기본 테이블 존재 확인
             required_tables = ["cmap", "head", "name", "OS/2"]
@@ -461,7 +830,7 @@ class FontMerger:
 
         Args:
             font_path: 폰트 파일 경로
-            selected_charsets: 선택된 문자셋 딕셔너리
+            selected_charsets: 선택된 문자셋 딕셔너리 (이름 -> 코드포인트 집합)
 
         Returns:
             TTFont: 서브셋된 폰트 객체
@@ -470,29 +839,33 @@ class FontMerger:
             return None
 
         try:
-            font = TTFont(font_path)
+            # 선택된 모든 코드포인트를 하나의 집합으로 합치기
+            # (겹치는 문자셋 범위는 한 번의 합집합 연산으로 중복 제거)
+            unicodes = set().union(*selected_charsets.values())
 
-            # 선택된 모든 문자들을 하나의 리스트로 합치기
-            all_chars = []
-            for chars in selected_charsets.values():
-                all_chars.extend(chars)
-
-            if not all_chars:
+            if not unicodes:
                 return None
 
-            # 유니코드 코드포인트로 변환 (실제 문자만)
-            unicodes = []
-            for char in all_chars:
-                if len(char) == 1:  # 실제 단일 문자만 처리
-                    unicodes.append(ord(char))
-                # 글리프 이름은 무시 (lig_0, liga_feature 등)
+            # HarfBuzz를 사용할 수 있으면 hb-subset으로 서브셋 생성
+            if HARFBUZZ_AVAILABLE:
+                # hb-subset은 WOFF/WOFF2를 읽지 못하므로 시그니처만 먼저 확인
+                with open(font_path, "rb") as f:
+                    font_data = None
+                    if f.read(4) not in (b"wOFF", b"wOF2"):
+                        f.seek(0)
+                        font_data = f.read()
+                if font_data is not None:
+                    return self._create_font_subset_with_harfbuzz(font_data, unicodes)
 
-            if not unicodes:
-                return None
+            # 서브셋 과정에서 폰트가 변경되므로 캐시와 별도로 로드
+            font = TTFont(_open_mmap(font_path), lazy=True)
+
+            # 서브셋터 생성 및 설정 (fontTools.subset은 필요할 때만 import)
+            from fontTools.subset import Subsetter
 
-            # 서브셋터 생성 및 설정
             subsetter = Subsetter()
-            subsetter.options.retain_gids = True
+            # 병합 입력용이므로 원본 글리프 ID를 유지하지 않음 (빈 슬롯 제거)
+            subsetter.options.retain_gids = False
             subsetter.options.notdef_outline = True
             subsetter.options.recommended_glyphs = True
             subsetter.options.name_IDs = ["*"]
@@ -504,6 +877,8 @@ class FontMerger:
             subsetter.options.glyph_names = True  # 글리프 이름 유지
             subsetter.options.legacy_kern = True  # 커닝 정보 유지
             subsetter.options.hinting = True  # 힌팅 정보 유지
+            # CFF 서브루틴을 인라인하여 서브루틴 재계산 생략 (병합 입력용)
+            subsetter.options.desubroutinize = True
 
             # 서브셋 생성
             subsetter.populate(unicodes=unicodes)
@@ -514,13 +889,52 @@ class FontMerger:
         except Exception as e:
             raise Exception(f"폰트 서브셋 생성 중 오류: {str(e)}") from e
 
+    def _create_font_subset_with_harfbuzz(self, font_data, unicodes):
+        """
+        HarfBuzz hb-subset으로 서브셋 생성 (fontTools Subsetter와 같은 옵션)
+
+        Args:
+            font_data: 폰트 파일 바이트
+            unicodes: 유지할 유니코드 코드포인트 목록
+
+        Returns:
+            TTFont: 서브셋된 폰트 객체
+        """
+        face = hb.Face(font_data)
+
+        subset_input = hb.SubsetInput()
+        subset_input.unicode_set.update(unicodes)
+        # 병합 입력용이므로 원본 글리프 ID는 유지하지 않음 (RETAIN_GIDS 미사용)
+        # CFF 서브루틴은 인라인 (DESUBROUTINIZE)
+        subset_input.flags = (
+            hb.SubsetFlags.NOTDEF_OUTLINE
+            | hb.SubsetFlags.NAME_LEGACY
+            | hb.SubsetFlags.GLYPH_NAMES
+            | hb.SubsetFlags.DESUBROUTINIZE
+        )
+
+        # 합자(ligature) 및 OpenType 피처 보존 설정 (모든 피처, 모든 name ID)
+        subset_input.layout_feature_tag_set.clear()
+        subset_input.layout_feature_tag_set.invert()
+        subset_input.name_id_set.clear()
+        subset_input.name_id_set.invert()
+
+        # 커닝 정보 유지 (hb-subset은 기본적으로 kern 테이블을 삭제)
+        subset_input.drop_table_tag_set.discard(int.from_bytes(b"kern", "big"))
+
+        subset_face = hb.subset(face, subset_input)
+        if subset_face is None:
+            raise Exception("HarfBuzz 서브셋 생성에 실패했습니다")
+
+        return TTFont(io.BytesIO(subset_face.blob.data), lazy=True)
+
     def _merge_font_files(self, font1_path, font2_path, merge_option=0):
         """
         두 폰트 파일을 병합
 
         Args:
-            font1_path: 첫 번째 폰트 파일 경로
-            font2_path: 두 번째 폰트 파일 경로
+            font1_path: 첫 번째 폰트 파일 경로 또는 파일 객체
+            font2_path: 두 번째 폰트 파일 경로 또는 파일 객체
             merge_option: 병합 옵션 (0: 기본, 1: UPM 통일, 2: 관대한 옵션)
 
         Returns:
@@ -537,26 +951,33 @@ class FontMerger:
         except Exception as e:
             import traceback
 
+            # 실패한 병합의 상태가 재사용되는 병합기에 남지 않도록 정리
+            # (Merger는 fonts 속성이 있으면 병합 중인 폰트 목록으로 사용하므로 삭제)
+            for attr in ("fonts", "duplicateGlyphsPerFont"):
+                if hasattr(self.merger, attr):
+                    delattr(self.merger, attr)
+
             print(f"폰트 병합 세부 오류:\n{traceback.format_exc()}")
             raise Exception(f"폰트 병합 중 오류: {str(e)}") from e
 
     def _merge_with_default_options(self, font1_path, font2_path):
         """기본 옵션으로 폰트 병합"""
-        merger = Merger()
-        if hasattr(merger, "duplicateGlyphsPerFont"):
-            merger.duplicateGlyphsPerFont = True
-
-        # OpenType 피처 보존 설정
-        merger.options.drop_tables = []  # 테이블 삭제 방지
-
-        return merger.merge([font1_path, font2_path])
+        return self.merger.merge([font1_path, font2_path])
 
     def _merge_with_upm_unification(self, font1_path, font2_path):
         """UPM 통일 후 폰트 병합"""
-        font1 = TTFont(font1_path)
-        font2 = TTFont(font2_path)
+        font1 = TTFont(font1_path, lazy=True)
+        font2 = TTFont(font2_path, lazy=True)
 
-        # units per em 통일 (더 큰 값으로)
+        self._unify_upm(font1, font2)
+
+        # 조정된 폰트를 메모리 버퍼로 저장 후 병합
+        return self.merger.merge(
+            [self._save_to_buffer(font1), self._save_to_buffer(font2)]
+        )
+
+    def _unify_upm(self, font1, font2):
+        """두 폰트의 units per em을 더 큰 값으로 통일"""
         if "head" in font1 and "head" in font2:
             upm1 = font1["head"].unitsPerEm
             upm2 = font2["head"].unitsPerEm
@@ -570,66 +991,38 @@ class FontMerger:
                 if upm2 != target_upm:
                     font2["head"].unitsPerEm = target_upm
 
-        # 조정된 폰트를 임시 파일로 저장 후 병합
-        with tempfile.NamedTemporaryFile(suffix=".ttf", delete=False) as temp1:
-            font1.save(temp1.name)
-            adjusted_font1_path = temp1.name
-
-        with tempfile.NamedTemporaryFile(suffix=".ttf", delete=False) as temp2:
-            font2.save(temp2.name)
-            adjusted_font2_path = temp2.name
-
-        try:
-            merger = Merger()
-            if hasattr(merger, "duplicateGlyphsPerFont"):
-                merger.duplicateGlyphsPerFont = True
-
-            # OpenType 피처 보존 설정
-            merger.options.drop_tables = []  # 테이블 삭제 방지
-
-            return merger.merge([adjusted_font1_path, adjusted_font2_path])
-        finally:
-            os.unlink(adjusted_font1_path)
-            os.unlink(adjusted_font2_path)
-
     def _merge_with_lenient_options(self, font1_path, font2_path):
         """관대한 옵션으로 폰트 병합"""
         try:
             # 기본 병합 시도
             return self._merge_with_default_options(font1_path, font2_path)
         except Exception:
-            # 실패하면 UPM 통일 후 재시도
-            try:
-                return self._merge_with_upm_unification(font1_path, font2_path)
-            except Exception:
-                # 그래도 실패하면 더 관대한 설정으로 시도
-                font1 = TTFont(font1_path)
-                font2 = TTFont(font2_path)
-
-                # 디지털 서명만 제거 (GSUB, GPOS는 합자에 필요하므로 보존)
-                for table_name in ["DSIG"]:
-                    if table_name in font1:
-                        del font1[table_name]
-                    if table_name in font2:
-                        del font2[table_name]
-
-                # 임시 파일로 저장 후 병합
-                with tempfile.NamedTemporaryFile(suffix=".ttf", delete=False) as temp1:
-                    font1.save(temp1.name)
-                    simplified_font1_path = temp1.name
-
-                with tempfile.NamedTemporaryFile(suffix=".ttf", delete=False) as temp2:
-                    font2.save(temp2.name)
-                    simplified_font2_path = temp2.name
-
-                try:
-                    merger = Merger()
-                    # OpenType 피처 보존 설정
-                    merger.options.drop_tables = []  # 테이블 삭제 방지
-                    return merger.merge([simplified_font1_path, simplified_font2_path])
-                finally:
-                    os.unlink(simplified_font1_path)
-                    os.unlink(simplified_font2_path)
+            pass
+
+        # 실패하면 UPM 통일 후 재시도 (이후 단계에서도 같은 폰트 객체 재사용)
+        font1 = TTFont(font1_path, lazy=True)
+        font2 = TTFont(font2_path, lazy=True)
+        self._unify_upm(font1, font2)
+
+        try:
+            return self.merger.merge(
+                [self._save_to_buffer(font1), self._save_to_buffer(font2)]
+            )
+        except Exception:
+            pass
+
+        # 그래도 실패하면 더 관대한 설정으로 시도
+        # 디지털 서명만 제거 (GSUB, GPOS는 합자에 필요하므로 보존)
+        for table_name in ["DSIG"]:
+            if table_name in font1:
+                del font1[table_name]
+            if table_name in font2:
+                del font2[table_name]
+
+        # 메모리 버퍼로 저장 후 병합
+        return self.merger.merge(
+            [self._save_to_buffer(font1), self._save_to_buffer(font2)]
+        )
 
     def validate_fonts(self, font1_path, font2_path):
         """
@@ -650,16 +1043,14 @@ class FontMerger:
             if not os.path.exists(font2_path):
                 return False, f"두 번째 폰트 파일을 찾을 수 없습니다: {font2_path}"
 
-            # 폰트 파일 로드 테스트
+            # 폰트 파일 헤더 확인
             try:
-                font1 = TTFont(font1_path)
-                font1.close()
+                self._check_font_file(font1_path)
             except Exception as e:
                 return False, f"첫 번째 폰트 파일이 유효하지 않습니다: {str(e)}"
 
             try:
-                font2 = TTFont(font2_path)
-                font2.close()
+                self._check_font_file(font2_path)
             except Exception as e:
                 return False, f"두 번째 폰트 파일이 유효하지 않습니다: {str(e)}"
 
@@ -668,6 +1059,16 @@ class FontMerger:
         except Exception as e:
             return False, f"폰트 유효성 검사 중 오류: {str(e)}"
 
+    def _check_font_file(self, font_path):
+        """
+        폰트 파일의 SFNT 헤더 확인 (파일 앞 4바이트만 읽음)
+
+        Args:
+            font_path: 폰트 파일 경로
+        """
+        if not _sniff_sfnt(font_path):
+            raise Exception("지원되지 않는 폰트 형식입니다")
+
     def _update_font_name(self, font, font_name):
         """
         폰트의 이름을 업데이트
@@ -690,45 +1091,36 @@ class FontMerger:
         # 16: Typographic Family name (선택적)
         # 17: Typographic Subfamily name (선택적)
 
-        # 기본 이름들은 모두 새 이름으로 설정
-        primary_name_ids = [1, 4, 6]
-
-        # 먼저 모든 기존 이름 레코드를 확인하고 업데이트
-        for name_record in name_table.names[:]:  # 복사본으로 순회
-            if name_record.nameID in primary_name_ids:
-                # 기존 레코드 제거
-                name_table.names.remove(name_record)
+        # 새 이름으로 교체할 name ID들 (16/17 Typographic names 포함)
+        replaced_name_ids = {1, 4, 6, 16, 17}
 
-        # 새로운 이름들 추가
-        platforms = [
-            (3, 1, 0x409),  # Windows, Unicode BMP, English US
-            (1, 0, 0),  # Macintosh, Roman, English
+        # 먼저 모든 기존 이름 레코드를 한 번에 제거
+        name_table.names = [
+            name_record
+            for name_record in name_table.names
+            if name_record.nameID not in replaced_name_ids
         ]
 
-        for platform_id, encoding_id, language_id in platforms:
+        # PostScript name (ID 6) - 공백 제거하고 특수문자 처리
+        ps_name = font_name.replace(" ", "").replace("-", "")
+        # Unique identifier (ID 3) - 버전 정보 포함
+        unique_id = f"{font_name}: 2023"
+
+        # 새로운 이름들 추가
+        for platform_id, encoding_id, language_id in _NAME_PLATFORMS:
             # Font Family name (ID 1)
             name_table.setName(font_name, 1, platform_id, encoding_id, language_id)
 
             # Full font name (ID 4)
             name_table.setName(font_name, 4, platform_id, encoding_id, language_id)
 
-            # PostScript name (ID 6) - 공백 제거하고 특수문자 처리
-            ps_name = font_name.replace(" ", "").replace("-", "")
+            # PostScript name (ID 6)
             name_table.setName(ps_name, 6, platform_id, encoding_id, language_id)
 
-            # Unique identifier (ID 3) - 버전 정보 포함
-            unique_id = f"{font_name}: 2023"
+            # Unique identifier (ID 3)
             name_table.setName(unique_id, 3, platform_id, encoding_id, language_id)
 
-        # Typographic names도 설정 (있는 경우)
-        for name_record in name_table.names[:]:
-            if name_record.nameID == 16:  # Typographic Family name
-                name_table.names.remove(name_record)
-            elif name_record.nameID == 17:  # Typographic Subfamily name
-                name_table.names.remove(name_record)
-
-        # 새로운 Typographic names 추가
-        for platform_id, encoding_id, language_id in platforms:
+            # Typographic Family / Subfamily name (ID 16, 17)
             name_table.setName(font_name, 16, platform_id, encoding_id, language_id)
             name_table.setName("Regular", 17, platform_id, encoding_id, language_id)
 
@@ -747,21 +1139,16 @@ class FontMerger:
             os2_table = font["OS/2"]
 
             # Unicode Range 설정 (한글 지원 추가 - 기존 값 보존)
-            # Bit 28: Hangul Jamo (U+1100-U+11FF)
-            # Bit 29: Hangul Syllables (U+AC00-U+D7AF)
-            # Bit 30: Hangul Compatibility Jamo (U+3130-U+318F)
             if hasattr(os2_table, "ulUnicodeRange1"):
                 # 기존 값에 한글 범위만 추가 (OR 연산으로 기존 비트 보존)
-                korean_ranges = (1 << 28) | (1 << 29) | (1 << 30)
-                os2_table.ulUnicodeRange1 |= korean_ranges
+                os2_table.ulUnicodeRange1 |= _OS2_KOREAN_URANGE1
 
             # Unicode Range 2, 3, 4도 보존 (다른 언어 및 특수 문자 지원)
             # 이 값들을 건드리지 않아야 합자 등이 유지됨
 
             # Code Page Range 설정 (한국어 지원 추가 - 기존 값 보존)
-            # Bit 19: Korean (Wansung) - 949
             if hasattr(os2_table, "ulCodePageRange1"):
-                os2_table.ulCodePageRange1 |= 1 << 19
+                os2_table.ulCodePageRange1 |= _OS2_KOREAN_CPRANGE1
 
             # Weight과 Width 설정 (VSCode 호환성)
             if hasattr(os2_table, "usWeightClass"):
@@ -849,8 +1236,11 @@ class FontMerger:
 
         # cmap 테이블에서 일반적인 합자 글리프 확인
         if "cmap" in font:
-            cmap = font.getBestCmap()
-            if cmap:
+            # 병합된 전체 cmap을 만들지 않고 유니코드 서브테이블에서 직접 확인
+            unicode_subtables = [
+                subtable for subtable in font["cmap"].tables if subtable.isUnicode()
+            ]
+            if unicode_subtables:
                 # 일반적인 합자 문자들 확인
                 ligature_chars = [
                     0x2192,  # →
@@ -860,10 +1250,11 @@ class FontMerger:
                     0x2265,  # ≥
                 ]
 
-                found_ligature_chars = []
-                for char_code in ligature_chars:
-                    if char_code in cmap:
-                        found_ligature_chars.append(f"U+{char_code:04X}")
+                found_ligature_chars = [
+                    f"U+{char_code:04X}"
+                    for char_code in ligature_chars
+                    if any(char_code in subtable.cmap for subtable in unicode_subtables)
+                ]
 
                 if found_ligature_chars:
                     print(
@@ -880,14 +1271,14 @@ class FontMerger:
 
         Args:
             merged_font: 병합된 TTFont 객체
-            font1_path: 첫 번째 폰트 경로 (기본 폰트)
-            font2_path: 두 번째 폰트 경로 (보조 폰트)
+            base_font_path: 기본 폰트 경로 또는 파일 객체
+            secondary_font_path: 보조 폰트 경로 또는 파일 객체
         """
         print("=== 합자 지원 복원 시작 ===")
 
         # 원본 폰트들 로드
-        base_font = TTFont(base_font_path)
-        secondary_font = TTFont(secondary_font_path)
+        base_font = TTFont(base_font_path, lazy=True)
+        secondary_font = TTFont(secondary_font_path, lazy=True)
 
         # 기본 폰트의 합자 기능 확인 (사용자 선택 우선)
         base_ligature_score = self._calculate_ligature_score_from_font(base_font)
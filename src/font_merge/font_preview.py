@@ -13,6 +13,9 @@ class FontPreview(QLabel):
     def __init__(self, preview_text="가나다라마바사 ABC123"):
         super().__init__()
         self.preview_text = preview_text
+        # 현재 Qt 폰트 데이터베이스에 등록된 폰트 (같은 파일 재등록 방지)
+        self._font_path = None
+        self._font_id = -1
         self.init_ui()
 
     def init_ui(self):
@@ -25,8 +28,8 @@ class FontPreview(QLabel):
     def update_preview(self, font_path):
         """폰트 파일로 프리뷰 업데이트"""
         if font_path and os.path.exists(font_path):
-            # 폰트 파일을 시스템에 로드
-            font_id = QFontDatabase.addApplicationFont(font_path)
+            # 폰트 파일을 시스템에 로드 (이미 등록된 파일이면 재사용)
+            font_id = self._register_font(font_path)
             if font_id != -1:
                 # 로드된 폰트 패밀리 이름 가져오기
                 font_families = QFontDatabase.applicationFontFamilies(font_id)
@@ -43,6 +46,19 @@ class FontPreview(QLabel):
         else:
             self.setText("폰트를 선택하세요")
 
+    def _register_font(self, font_path):
+        """폰트를 Qt 폰트 데이터베이스에 등록하고 이전에 등록한 폰트는 해제"""
+        if font_path == self._font_path:
+            return self._font_id
+
+        if self._font_id != -1:
+            QFontDatabase.removeApplicationFont(self._font_id)
+
+        # 등록에 실패한 경로는 기억하지 않음 (다음 호출 때 다시 시도)
+        self._font_id = QFontDatabase.addApplicationFont(font_path)
+        self._font_path = font_path if self._font_id != -1 else None
+        return self._font_id
+
     def set_preview_text(self, text):
         """프리뷰 텍스트 변경"""
         self.preview_text = text
@@ -1,9 +1,10 @@
 """폰트 선택 위젯"""
 
 import os
+import re
 
 from fontTools.ttLib import TTFont
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtWidgets import (
     QCheckBox,
     QFileDialog,
@@ -21,13 +22,144 @@ from PyQt6.QtWidgets import (
 try:
     # 상대 import 시도
     from .font_info import FontInfo
+    from .font_merger import load_cmap_codes
     from .font_preview import FontPreview
 except (ImportError, ValueError):
     # 절대 import 시도 (PyInstaller 환경)
     from font_merge.font_info import FontInfo
+    from font_merge.font_merger import load_cmap_codes
     from font_merge.font_preview import FontPreview
 
 
+# 문자셋 범위 정의 (이름: (시작 코드포인트, 끝 코드포인트))
+_CHARSET_RANGE_BOUNDS = {
+    "영문 대문자": (0x0041, 0x005A),
+    "영문 소문자": (0x0061, 0x007A),
+    "숫자": (0x0030, 0x0039),
+    "한글": (0xAC00, 0xD7AF),
+    "한글 자모": (0x1100, 0x11FF),
+    "한글 호환 자모": (0x3130, 0x318F),
+    "한글 반자모": (0xFFA0, 0xFFDC),
+    "기본 기호": (0x0020, 0x007F),
+    "라틴 확장 A": (0x0100, 0x017F),
+    "라틴 확장 B": (0x0180, 0x024F),
+    "일반 구두점": (0x2000, 0x206F),
+    "위 첨자/아래 첨자": (0x2070, 0x209F),
+    "통화 기호": (0x20A0, 0x20CF),
+    "CJK 기호": (0x3000, 0x303F),
+    "히라가나": (0x3040, 0x309F),
+    "가타카나": (0x30A0, 0x30FF),
+    "CJK 통합 한자": (0x4E00, 0x9FFF),
+    "CJK 확장 A": (0x3400, 0x4DBF),
+    "표준 합자": (0xFB00, 0xFB4F),
+    "프로그래밍 합자 1": (0xE000, 0xE0FF),
+    "프로그래밍 합자 2": (0xE100, 0xE1FF),
+    "확장 합자": (0xF000, 0xF0FF),
+    "수학 기호": (0x2200, 0x22FF),
+    "화살표": (0x2190, 0x21FF),
+    "박스 그리기": (0x2500, 0x257F),
+    "블록 요소": (0x2580, 0x259F),
+    "기하학적 도형": (0x25A0, 0x25FF),
+    "NerdFonts 아이콘": (0xE000, 0xF8FF),
+    "Powerline": (0xE0A0, 0xE0A2),
+    "Powerline Extra": (0xE0B0, 0xE0B3),
+    "Font Awesome": (0xF000, 0xF2E0),
+    "Weather Icons": (0xF300, 0xF32F),
+    "Seti-UI": (0xE5FA, 0xE62B),
+    "Devicons": (0xE700, 0xE7C5),
+    "Octicons": (0xF400, 0xF4A9),
+    "Material Design": (0xF500, 0xFD46),
+    "Codicons": (0xEA60, 0xEBEB),
+    "Pomicons": (0xE000, 0xE00D),
+}
+
+# 범위별 코드포인트 집합은 import 시 한 번만 생성
+_CHARSET_RANGES = tuple(
+    (range_name, (start, end), frozenset(range(start, end + 1)))
+    for range_name, (start, end) in _CHARSET_RANGE_BOUNDS.items()
+)
+
+# 합자 글리프 이름 패턴 (대소문자 무시)
+_LIGATURE_GLYPH_RE = re.compile(r"liga|ffi|ffl|arrow|equal|fi|fl|ff", re.IGNORECASE)
+
+
+class CharsetLoadWorker(QThread):
+    """문자셋 옵션 계산을 백그라운드에서 수행하는 워커 스레드"""
+
+    # 시그널 정의
+    # (폰트 경로, 문자셋 이름 -> 계산 결과, 문자셋 목록이 cmap 전체를 포함하는지)
+    loaded = pyqtSignal(str, dict, bool)
+    failed = pyqtSignal(str, str)  # (폰트 경로, 오류 내용)
+
+    def __init__(self, font_path, parent=None):
+        super().__init__(parent)
+        self.font_path = font_path
+
+    def run(self):
+        """폰트 파싱 및 문자셋 범위별 교집합 계산 실행"""
+        try:
+            # 코드포인트 집합은 공유 캐시에서 가져옴 (이후 조회는 다시 파싱하지 않음)
+            cmap_codes = load_cmap_codes(self.font_path)
+
+            # 합자 정보 확인 (캐시된 TTFont는 GUI 스레드에서도 지연 로딩 중이므로
+            # 공유하지 않고 워커 전용 인스턴스를 연다)
+            with TTFont(self.font_path, lazy=True) as font:
+                ligature_glyphs = _find_ligature_glyphs(font)
+
+            options = {}
+            for range_name, (start, end), range_codes in _CHARSET_RANGES:
+                # cmap 코드포인트 집합과 범위의 교집합 (C 수준 집합 연산)
+                available_codes = cmap_codes & range_codes
+                char_count = len(available_codes)
+
+                # 표준 합자의 경우 실제 합자 글리프 수도 포함
+                if range_name == "표준 합자" and ligature_glyphs:
+                    char_count += len(ligature_glyphs)
+
+                options[range_name] = {
+                    "chars": available_codes,
+                    "range": (start, end),
+                    "count": char_count,
+                }
+
+            # 어느 문자셋 범위에도 속하지 않는 코드포인트가 있는지 확인
+            covered = not cmap_codes.difference(*(r[2] for r in _CHARSET_RANGES))
+
+            self.loaded.emit(self.font_path, options, covered)
+
+        except Exception as e:
+            self.failed.emit(self.font_path, str(e))
+
+
+def _find_ligature_glyphs(font):
+    """폰트에서 합자 글리프 찾기"""
+    ligature_glyphs = []
+    try:
+        # GSUB 테이블에서 합자 정보 확인
+        if "GSUB" in font:
+            gsub = font["GSUB"]
+            if hasattr(gsub, "table") and hasattr(gsub.table, "FeatureList"):
+                feature_list = gsub.table.FeatureList
+                if hasattr(feature_list, "FeatureRecord"):
+                    for feature_record in feature_list.FeatureRecord:
+                        # 'liga' (Standard Ligatures) 기능 찾기
+                        if feature_record.FeatureTag == "liga":
+                            ligature_glyphs.append("liga_feature")
+
+        # 글리프 이름에서 합자 패턴 찾기
+        if hasattr(font, "getGlyphSet"):
+            glyph_set = font.getGlyphSet()
+            for glyph_name in glyph_set.keys():
+                # 일반적인 합자 글리프 이름 패턴
+                if _LIGATURE_GLYPH_RE.search(glyph_name):
+                    ligature_glyphs.append(glyph_name)
+
+    except Exception:
+        pass  # 오류 시 빈 리스트 반환
+
+    return ligature_glyphs
+
+
 class FontSelector(QGroupBox):
     """폰트 파일 선택 및 문자셋 선택을 제공하는 위젯"""
 
@@ -39,6 +171,8 @@ class FontSelector(QGroupBox):
         self.font_path = None
         self.charset_checkboxes = {}
         self.other_selector = None  # 반대편 FontSelector 참조
+        self._charset_worker = None  # 진행 중인 문자셋 계산 워커
+        self._charsets_cover_font = False  # 문자셋 목록이 cmap 전체를 포함하는지
         self.init_ui()
 
     def init_ui(self):
@@ -129,116 +263,107 @@ class FontSelector(QGroupBox):
             self.font_changed.emit()
 
     def load_charset_options(self):
-        """폰트의 문자셋 옵션 로드"""
+        """폰트의 문자셋 옵션 로드 (계산은 백그라운드 스레드에서 수행)"""
         # 기존 체크박스 제거
-        for i in reversed(range(self.charset_layout.count())):
-            widget = self.charset_layout.itemAt(i).widget()
+        while (item := self.charset_layout.takeAt(0)) is not None:
+            widget = item.widget()
             if widget:
-                widget.setParent(None)
+                widget.deleteLater()
 
         self.charset_checkboxes.clear()
+        self._charsets_cover_font = False
+
+        # 이전 폰트의 계산이 남아 있으면 결과를 버리고 종료 대기
+        self.stop_charset_worker()
 
         if not self.font_path:
             return
 
-        try:
-            font = TTFont(self.font_path)
-            cmap = font.getBestCmap()
-
-            # 합자 정보 확인
-            ligature_glyphs = self._find_ligature_glyphs(font)
-
-            # 문자셋 범위별로 분류
-            charset_ranges = self._get_charset_ranges()
-
-            for range_name, (start, end) in charset_ranges.items():
-                if "합자" in range_name or "Ligature" in range_name:
-                    # 합자의 경우 실제 합자 글리프 수 사용
-                    if range_name == "표준 합자":
-                        available_chars = [
-                            chr(code) for code in range(start, end + 1) if code in cmap
-                        ]
-                        if ligature_glyphs:
-                            available_chars.extend(
-                                [f"lig_{i}" for i in range(len(ligature_glyphs))]
-                            )
-                    else:
-                        available_chars = [
-                            chr(code) for code in range(start, end + 1) if code in cmap
-                        ]
-                else:
-                    available_chars = [
-                        chr(code) for code in range(start, end + 1) if code in cmap
-                    ]
+        # 계산이 끝날 때까지 파일 선택 버튼 비활성화
+        self.select_button.setEnabled(False)
 
-                checkbox = QCheckBox(f"{range_name} ({len(available_chars)}자)")
-                checkbox.setEnabled(len(available_chars) > 0)
-                checkbox.setChecked(len(available_chars) > 0)
+        worker = CharsetLoadWorker(self.font_path, self)
+        worker.loaded.connect(
+            self._on_charset_options_loaded, Qt.ConnectionType.QueuedConnection
+        )
+        worker.failed.connect(
+            self._on_charset_options_failed, Qt.ConnectionType.QueuedConnection
+        )
+        self._charset_worker = worker
+        worker.start()
 
-                self.charset_checkboxes[range_name] = {
-                    "checkbox": checkbox,
-                    "chars": available_chars,
-                    "range": (start, end),
-                }
+    def stop_charset_worker(self):
+        """진행 중인 문자셋 계산 워커의 시그널을 끊고 종료될 때까지 대기"""
+        worker = self._charset_worker
+        if worker is None:
+            return
 
-                self.charset_layout.addWidget(checkbox)
+        self._charset_worker = None
+        worker.loaded.disconnect()
+        worker.failed.disconnect()
+        worker.wait()
+        worker.deleteLater()
 
-        except Exception as e:
-            QMessageBox.warning(
-                self, "오류", f"폰트 파일을 읽는 중 오류가 발생했습니다: {str(e)}"
-            )
-
-    def _get_charset_ranges(self):
-        """문자셋 범위 정의"""
-        return {
-            "영문 대문자": (0x0041, 0x005A),
-            "영문 소문자": (0x0061, 0x007A),
-            "숫자": (0x0030, 0x0039),
-            "한글": (0xAC00, 0xD7AF),
-            "한글 자모": (0x1100, 0x11FF),
-            "한글 호환 자모": (0x3130, 0x318F),
-            "한글 반자모": (0xFFA0, 0xFFDC),
-            "기본 기호": (0x0020, 0x007F),
-            "라틴 확장 A": (0x0100, 0x017F),
-            "라틴 확장 B": (0x0180, 0x024F),
-            "일반 구두점": (0x2000, 0x206F),
-            "위 첨자/아래 첨자": (0x2070, 0x209F),
-            "통화 기호": (0x20A0, 0x20CF),
-            "CJK 기호": (0x3000, 0x303F),
-            "히라가나": (0x3040, 0x309F),
-            "가타카나": (0x30A0, 0x30FF),
-            "CJK 통합 한자": (0x4E00, 0x9FFF),
-            "CJK 확장 A": (0x3400, 0x4DBF),
-            "표준 합자": (0xFB00, 0xFB4F),
-            "프로그래밍 합자 1": (0xE000, 0xE0FF),
-            "프로그래밍 합자 2": (0xE100, 0xE1FF),
-            "확장 합자": (0xF000, 0xF0FF),
-            "수학 기호": (0x2200, 0x22FF),
-            "화살표": (0x2190, 0x21FF),
-            "박스 그리기": (0x2500, 0x257F),
-            "블록 요소": (0x2580, 0x259F),
-            "기하학적 도형": (0x25A0, 0x25FF),
-            "NerdFonts 아이콘": (0xE000, 0xF8FF),
-            "Powerline": (0xE0A0, 0xE0A2),
-            "Powerline Extra": (0xE0B0, 0xE0B3),
-            "Font Awesome": (0xF000, 0xF2E0),
-            "Weather Icons": (0xF300, 0xF32F),
-            "Seti-UI": (0xE5FA, 0xE62B),
-            "Devicons": (0xE700, 0xE7C5),
-            "Octicons": (0xF400, 0xF4A9),
-            "Material Design": (0xF500, 0xFD46),
-            "Codicons": (0xEA60, 0xEBEB),
-            "Pomicons": (0xE000, 0xE00D),
-        }
+    def _on_charset_options_loaded(self, font_path, options, covered):
+        """백그라운드 계산 결과로 문자셋 체크박스 생성"""
+        self.select_button.setEnabled(True)
+
+        # 그 사이 다른 폰트가 선택되었다면 결과 무시
+        if font_path != self.font_path:
+            return
+
+        self._charsets_cover_font = covered
+
+        for range_name, data in options.items():
+            char_count = data["count"]
+
+            checkbox = QCheckBox(f"{range_name} ({char_count}자)")
+            checkbox.setEnabled(char_count > 0)
+            checkbox.setChecked(char_count > 0)
+
+            self.charset_checkboxes[range_name] = {
+                "checkbox": checkbox,
+                "chars": data["chars"],
+                "range": data["range"],
+            }
+
+            self.charset_layout.addWidget(checkbox)
+
+    def _on_charset_options_failed(self, font_path, error):
+        """백그라운드 계산 실패 시 오류 표시"""
+        self.select_button.setEnabled(True)
+
+        if font_path != self.font_path:
+            return
+
+        QMessageBox.warning(
+            self, "오류", f"폰트 파일을 읽는 중 오류가 발생했습니다: {error}"
+        )
 
     def get_selected_charsets(self):
-        """선택된 문자셋 반환"""
+        """선택된 문자셋 반환 (문자셋 이름 -> 유니코드 코드포인트 frozenset)"""
         selected = {}
         for range_name, data in self.charset_checkboxes.items():
             if data["checkbox"].isChecked():
                 selected[range_name] = data["chars"]
         return selected
 
+    def selection_covers_font(self):
+        """
+        선택된 문자셋이 폰트의 모든 cmap 코드포인트를 포함하는지 확인
+
+        워커가 계산해 둔 결과만 사용하므로 폰트 파일을 다시 읽지 않음
+        """
+        if not self._charsets_cover_font:
+            return False
+
+        # 문자셋 목록이 cmap 전체를 포함하므로 모든 문자셋의 문자가 선택에 있으면 됨
+        all_codes = set().union(
+            *(data["chars"] for data in self.charset_checkboxes.values())
+        )
+        selected_codes = set().union(*self.get_selected_charsets().values())
+        return selected_codes >= all_codes
+
     def has_font_selected(self):
         """폰트가 선택되었는지 확인"""
         return self.font_path is not None
@@ -287,43 +412,3 @@ class FontSelector(QGroupBox):
             checkbox = data["checkbox"]
             if checkbox.isEnabled():
                 checkbox.setChecked(False)
-
-    def _find_ligature_glyphs(self, font):
-        """폰트에서 합자 글리프 찾기"""
-        ligature_glyphs = []
-        try:
-            # GSUB 테이블에서 합자 정보 확인
-            if "GSUB" in font:
-                gsub = font["GSUB"]
-                if hasattr(gsub, "table") and hasattr(gsub.table, "FeatureList"):
-                    feature_list = gsub.table.FeatureList
-                    if hasattr(feature_list, "FeatureRecord"):
-                        for feature_record in feature_list.FeatureRecord:
-                            # 'liga' (Standard Ligatures) 기능 찾기
-                            if feature_record.FeatureTag == "liga":
-                                ligature_glyphs.append("liga_feature")
-
-            # 글리프 이름에서 합자 패턴 찾기
-            if hasattr(font, "getGlyphSet"):
-                glyph_set = font.getGlyphSet()
-                for glyph_name in glyph_set.keys():
-                    # 일반적인 합자 글리프 이름 패턴
-                    if any(
-                        pattern in glyph_name.lower()
-                        for pattern in [
-                            "liga",
-                            "fi",
-                            "fl",
-                            "ff",
-                            "ffi",
-                            "ffl",
-                            "arrow",
-                            "equal",
-                        ]
-                    ):
-                        ligature_glyphs.append(glyph_name)
-
-        except Exception:
-            pass  # 오류 시 빈 리스트 반환
-
-        return ligature_glyphs
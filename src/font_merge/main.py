@@ -1,12 +1,14 @@
+import functools
 import os
 import re
 import sys
+import threading
+from dataclasses import dataclass
 
 # Qt 디버그 로그 억제
 os.environ["QT_LOGGING_RULES"] = "*=false"
 
-from fontTools.ttLib import TTFont
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import (
     QApplication,
@@ -28,13 +30,140 @@ from PyQt6.QtWidgets import (
 # PyInstaller에서도 작동하는 안전한 import
 try:
     # 상대 import 시도
-    from .font_merger import FontMerger
+    from .font_merger import (
+        FontMerger,
+        _font_cache_key,
+        read_font_name,
+        read_font_upm,
+    )
     from .font_selector import FontSelector
 except (ImportError, ValueError):
     # 절대 import 시도 (PyInstaller 환경)
-    from font_merge.font_merger import FontMerger
+    from font_merge.font_merger import (
+        FontMerger,
+        _font_cache_key,
+        read_font_name,
+        read_font_upm,
+    )
     from font_merge.font_selector import FontSelector
 
+# 파일명에 사용할 수 없는 문자를 "_"로 바꾸는 변환 테이블
+_ILLEGAL_FILENAME_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
+
+# 병합 오류 메시지 분류용 키워드 패턴 (소문자 메시지 대상, 그룹 이름이 분류)
+_MERGE_ERROR_RE = re.compile(
+    r"(?P<upm>expected all items to be equal(?=.*\[))"
+    r"|(?P<compat>merge|table)"
+    r"|(?P<access>permission|access)"
+    r"|(?P<format>format|invalid)",
+    re.DOTALL,
+)
+
+# 오류 분류별 제안 메시지 (우선순위 순, 병합 옵션 -> 메시지, None은 모든 옵션)
+# 해당 옵션의 메시지가 없으면 다음 분류로 넘어감
+_MERGE_SUGGESTION_RULES = (
+    # Units per em 관련 오류
+    (
+        "upm",
+        {
+            0: (
+                "💡 해결책: 두 폰트의 Units per em 값이 다릅니다.\n"
+                "병합 옵션에서 'Units per em 통일'을 선택해보세요."
+            ),
+            1: (
+                "💡 해결책: UPM 통일로도 해결되지 않았습니다.\n"
+                "'관대한 병합 옵션'을 시도해보세요."
+            ),
+        },
+    ),
+    # 일반적인 호환성 문제
+    (
+        "compat",
+        {
+            0: (
+                "💡 해결책: 폰트 호환성 문제가 발생했습니다.\n"
+                "병합 옵션에서 'Units per em 통일' 또는 '관대한 병합 옵션'을 "
+                "시도해보세요."
+            ),
+            1: (
+                "💡 해결책: '관대한 병합 옵션'을 시도해보세요.\n"
+                "이 옵션은 호환성 문제를 우회하여 강제로 병합합니다."
+            ),
+        },
+    ),
+    # 파일 경로 또는 권한 관련 오류
+    (
+        "access",
+        {
+            None: (
+                "💡 해결책: 파일 접근 권한 문제입니다.\n"
+                "다른 위치에 저장하거나 파일이 사용 중이 아닌지 확인해보세요."
+            ),
+        },
+    ),
+    # 파일 형식 오류
+    (
+        "format",
+        {
+            None: (
+                "💡 해결책: 폰트 파일 형식에 문제가 있을 수 있습니다.\n"
+                "다른 폰트 파일을 시도하거나 파일이 손상되지 않았는지 확인해보세요."
+            ),
+        },
+    ),
+)
+
+# 해당하는 분류가 없을 때의 기본 제안 (None은 관대한 옵션도 실패한 경우)
+_DEFAULT_MERGE_SUGGESTIONS = {
+    0: (
+        "💡 해결책: 다른 병합 옵션을 시도해보세요:\n"
+        "• Units per em 통일: 폰트 크기 단위를 맞춤\n"
+        "• 관대한 병합 옵션: 호환성 문제를 우회하여 강제 병합"
+    ),
+    1: (
+        "💡 해결책: '관대한 병합 옵션'을 시도해보세요.\n"
+        "이 옵션은 더 강력한 호환성 처리를 제공합니다."
+    ),
+    None: (
+        "💡 해결책: 모든 병합 옵션이 실패했습니다.\n"
+        "• 다른 폰트 파일을 시도해보세요\n"
+        "• 선택한 문자셋을 줄여보세요\n"
+        "• 폰트 파일이 손상되지 않았는지 확인해보세요"
+    ),
+}
+
+# 연속된 폰트 변경 시그널을 한 번의 UPM 확인으로 합치는 대기 시간 (ms)
+_UPM_CHECK_DEBOUNCE_MS = 150
+
+# 애플리케이션 아이콘 경로 (import 시 한 번만 계산)
+_ICON_PATH = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "icon.png")
+)
+_ICON_EXISTS = os.path.exists(_ICON_PATH)
+
+
+@functools.cache
+def _get_app_icon():
+    """앱과 창이 함께 쓰는 아이콘 (QApplication 생성 후 첫 호출 시 생성, 없으면 None)"""
+    return QIcon(_ICON_PATH) if _ICON_EXISTS else None
+
+
+@dataclass(slots=True, frozen=True)
+class MergeJob:
+    """병합 작업 하나에 필요한 입력 묶음"""
+
+    base_font_path: str
+    base_charsets: dict  # 문자셋 이름 -> 유니코드 코드포인트 frozenset
+    secondary_font_path: str
+    secondary_charsets: dict
+    save_path: str
+    merge_option: int
+    font_name: str | None
+    output_format: str
+    use_base_whole: bool = False
+    # 유효성 검사 순서 (화면의 첫 번째/두 번째 폰트 순, None이면 병합 순서)
+    validate_paths: tuple | None = None
+
 
 class FontMergeWorker(QThread):
     """폰트 병합 작업을 백그라운드에서 수행하는 워커 스레드"""
@@ -42,63 +171,112 @@ class FontMergeWorker(QThread):
     # 작업 완료 시그널
     finished = pyqtSignal(bool, str)  # (성공 여부, 메시지/오류내용)
     progress = pyqtSignal(str)  # 진행 상황 메시지
+    invalid = pyqtSignal(str)  # 유효성 검사 실패 메시지
+    cancelled = pyqtSignal()  # 취소 요청으로 중단됨
 
-    def __init__(
-        self,
-        merger,
-        base_font_path,
-        base_charsets,
-        secondary_font_path,
-        secondary_charsets,
-        save_path,
-        merge_option,
-        font_name,
-        output_format,
-    ):
+    def __init__(self, merger, job):
         super().__init__()
         self.merger = merger
-        self.base_font_path = base_font_path
-        self.base_charsets = base_charsets
-        self.secondary_font_path = secondary_font_path
-        self.secondary_charsets = secondary_charsets
-        self.save_path = save_path
-        self.merge_option = merge_option
-        self.font_name = font_name
-        self.output_format = output_format
+        self.job = job
+        self._cancelled = threading.Event()
 
     def run(self):
-        """백그라운드에서 폰트 병합 수행"""
+        """백그라운드에서 폰트 유효성 검사 및 병합 수행"""
+        job = self.job
         try:
             self.progress.emit("폰트 파일을 분석하는 중...")
 
+            # 폰트 유효성 검사
+            validate_paths = job.validate_paths or (
+                job.base_font_path,
+                job.secondary_font_path,
+            )
+            is_valid, error_msg = self.merger.validate_fonts(*validate_paths)
+            if not is_valid:
+                self.invalid.emit(error_msg)
+                return
+
+            # 검사 중에 취소되었으면 병합을 시작하지 않음
+            if self.is_cancelled():
+                self.cancelled.emit()
+                return
+
             # 폰트 병합 실행
             success = self.merger.merge_fonts_with_format(
-                self.base_font_path,
-                self.base_charsets,
-                self.secondary_font_path,
-                self.secondary_charsets,
-                self.save_path,
-                self.merge_option,
-                self.font_name,
-                self.output_format,
+                job.base_font_path,
+                job.base_charsets,
+                job.secondary_font_path,
+                job.secondary_charsets,
+                job.save_path,
+                job.merge_option,
+                job.font_name,
+                job.output_format,
+                use_font1_whole=job.use_base_whole,
+                is_cancelled=self.is_cancelled,
             )
 
             if success:
                 self.finished.emit(
                     True,
-                    f"폰트가 성공적으로 합쳐졌습니다.\n저장 위치: {self.save_path}",
+                    f"폰트가 성공적으로 합쳐졌습니다.\n저장 위치: {job.save_path}",
                 )
             else:
                 self.finished.emit(False, "폰트 병합에 실패했습니다.")
 
         except Exception as e:
+            # 취소된 경우 오류 대신 중단되었음만 알림
+            if self.is_cancelled():
+                self.cancelled.emit()
+                return
             error_message = str(e)
             self.finished.emit(False, error_message)
 
+    def cancel(self):
+        """병합 취소 요청 (다음 단계로 넘어가기 전에 중단됨)"""
+        self._cancelled.set()
+
+    def is_cancelled(self):
+        """취소 요청 여부 반환"""
+        return self._cancelled.is_set()
+
+
+class UpmCheckWorker(QThread):
+    """두 폰트의 UPM 값을 백그라운드에서 읽는 워커 스레드"""
+
+    # 시그널 정의
+    checked = pyqtSignal(int, object, object)  # (요청 번호, 왼쪽 UPM, 오른쪽 UPM)
+
+    def __init__(self, generation, left_path, right_path, parent=None):
+        super().__init__(parent)
+        self.generation = generation
+        self.left_path = left_path
+        self.right_path = right_path
+
+    def run(self):
+        """UPM 읽기 실행 (실패한 폰트는 None)"""
+        self.checked.emit(
+            self.generation,
+            self._read_upm(self.left_path),
+            self._read_upm(self.right_path),
+        )
+
+    def _read_upm(self, font_path):
+        """폰트 파일에서 UPM 값 추출"""
+        try:
+            return read_font_upm(font_path)
+        except Exception:
+            return None
+
 
 class FontMergeApp(QMainWindow):
     def __init__(self):
         super().__init__()
+        # UPM 확인 요청 번호 (이전 요청의 늦은 결과를 무시하기 위함)
+        self._upm_generation = 0
+        # 마지막으로 UPM을 확인한 (왼쪽, 오른쪽) 폰트 파일 버전
+        self._last_upm_keys = None
+        # 병합기는 첫 병합 시 생성하여 재사용
+        self._merger = None
         self.init_ui()
 
     def init_ui(self):
@@ -106,11 +284,9 @@ class FontMergeApp(QMainWindow):
         self.setGeometry(100, 100, 1000, 700)
 
         # 아이콘 설정
-        icon_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "..", "..", "icon.png"
-        )
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        icon = _get_app_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -133,9 +309,13 @@ class FontMergeApp(QMainWindow):
         self.left_font.set_other_selector(self.right_font)
         self.right_font.set_other_selector(self.left_font)
 
-        # 폰트 변경 시 UPM 차이 확인을 위한 연결
-        self.left_font.font_changed.connect(self.check_upm_difference)
-        self.right_font.font_changed.connect(self.check_upm_difference)
+        # 폰트 변경 시 UPM 차이 확인을 위한 연결 (디바운스 타이머 경유)
+        self._upm_timer = QTimer(self)
+        self._upm_timer.setSingleShot(True)
+        self._upm_timer.setInterval(_UPM_CHECK_DEBOUNCE_MS)
+        self._upm_timer.timeout.connect(self.check_upm_difference)
+        self.left_font.font_changed.connect(self._upm_timer.start)
+        self.right_font.font_changed.connect(self._upm_timer.start)
 
         main_layout.addLayout(font_layout)
 
@@ -253,6 +433,19 @@ class FontMergeApp(QMainWindow):
             QMessageBox.warning(self, "경고", "최소 하나의 문자셋을 선택해주세요.")
             return
 
+        # 기본 폰트 설정에 따라 순서 결정 (사용자 선택 존중)
+        left_path = self.left_font.get_font_path()
+        right_path = self.right_font.get_font_path()
+        left_is_base = self.left_font.is_base_font()
+        if left_is_base:
+            base_font_path, base_charsets = left_path, left_charsets
+            secondary_font_path, secondary_charsets = right_path, right_charsets
+            base_selector = self.left_font
+        else:
+            base_font_path, base_charsets = right_path, right_charsets
+            secondary_font_path, secondary_charsets = left_path, left_charsets
+            base_selector = self.right_font
+
         # 파일 확장자와 필터 설정
         if output_format == "woff2":
             file_extension = ".woff2"
@@ -263,43 +456,17 @@ class FontMergeApp(QMainWindow):
             file_filter = "TrueType Font (*.ttf)"
             dialog_title = "합쳐진 폰트 저장 (TTF)"
 
-        # 폰트 이름 옵션 확인 (저장 파일명 결정용)
-        default_filename = f"merged_font{file_extension}"
-        if self.font_name_option_group.checkedId() == 1:  # 사용자 정의 이름
-            custom_name = self.font_name_input.text().strip()
-            if custom_name:
-                # 파일명에 사용할 수 없는 문자 제거
-                safe_name = self._sanitize_filename(custom_name)
-                default_filename = f"{safe_name}{file_extension}"
-        else:
-            # 기본 폰트 이름 사용
-            base_font_path = (
-                self.left_font.get_font_path()
-                if self.left_font.is_base_font()
-                else self.right_font.get_font_path()
-            )
-            base_font_name = self._extract_font_name(base_font_path)
-            if base_font_name:
-                safe_name = self._sanitize_filename(base_font_name)
-                default_filename = f"{safe_name}{file_extension}"
-
         # 저장 경로 선택
         save_path, _ = QFileDialog.getSaveFileName(
-            self, dialog_title, default_filename, file_filter
+            self,
+            dialog_title,
+            self._default_filename(file_extension, base_font_path),
+            file_filter,
         )
 
         if save_path:
             # 폰트 병합 수행
-            merger = FontMerger()
-
-            # 폰트 유효성 검사
-            is_valid, error_msg = merger.validate_fonts(
-                self.left_font.get_font_path(), self.right_font.get_font_path()
-            )
-
-            if not is_valid:
-                QMessageBox.warning(self, "오류", error_msg)
-                return
+            merger = self._get_merger()
 
             # 선택된 병합 옵션 가져오기
             merge_option = self.merge_option_group.checkedId()
@@ -311,20 +478,16 @@ class FontMergeApp(QMainWindow):
                 if custom_name:
                     font_name = custom_name
 
-            # 기본 폰트 설정에 따라 순서 결정 (사용자 선택 존중)
-            if self.left_font.is_base_font():
-                base_font_path = self.left_font.get_font_path()
-                base_charsets = left_charsets
-                secondary_font_path = self.right_font.get_font_path()
-                secondary_charsets = right_charsets
+            if left_is_base:
                 print("✓ 왼쪽 폰트를 기본 폰트로 사용합니다 (합자 포함)")
             else:
-                base_font_path = self.right_font.get_font_path()
-                base_charsets = right_charsets
-                secondary_font_path = self.left_font.get_font_path()
-                secondary_charsets = left_charsets
                 print("✓ 오른쪽 폰트를 기본 폰트로 사용합니다 (합자 포함)")
 
+            # 선택된 문자셋이 기본 폰트의 cmap 전체를 덮으면 서브셋 없이 그대로 사용
+            # (목록의 범위 밖 코드포인트가 결과에 섞이지 않도록 문자셋 로드 시
+            # 워커가 계산해 둔 결과로 확인)
+            use_base_whole = base_selector.selection_covers_font()
+
             # 대기 다이얼로그 설정
             self.progress_dialog = QProgressDialog(
                 "폰트를 병합하는 중입니다...", "취소", 0, 0, self
@@ -336,8 +499,7 @@ class FontMergeApp(QMainWindow):
             self.progress_dialog.canceled.connect(self.cancel_merge)
 
             # 워커 스레드 생성 및 시작
-            self.worker = FontMergeWorker(
-                merger,
+            job = MergeJob(
                 base_font_path,
                 base_charsets,
                 secondary_font_path,
@@ -346,11 +508,24 @@ class FontMergeApp(QMainWindow):
                 merge_option,
                 font_name,
                 output_format,
+                use_base_whole,
+                (left_path, right_path),
             )
+            self.worker = FontMergeWorker(merger, job)
 
             # 시그널 연결
-            self.worker.finished.connect(self.on_merge_finished)
-            self.worker.progress.connect(self.on_progress_update)
+            self.worker.finished.connect(
+                self.on_merge_finished, Qt.ConnectionType.QueuedConnection
+            )
+            self.worker.progress.connect(
+                self.on_progress_update, Qt.ConnectionType.QueuedConnection
+            )
+            self.worker.invalid.connect(
+                self.on_merge_invalid, Qt.ConnectionType.QueuedConnection
+            )
+            self.worker.cancelled.connect(
+                self._enable_merge_buttons, Qt.ConnectionType.QueuedConnection
+            )
 
             # 병합 버튼들 비활성화
             self.merge_ttf_button.setEnabled(False)
@@ -360,11 +535,51 @@ class FontMergeApp(QMainWindow):
             self.worker.start()
             self.progress_dialog.show()
 
-    def cancel_merge(self):
-        """병합 작업 취소"""
+    def _default_filename(self, file_extension, base_font_path):
+        """저장 대화상자에 표시할 기본 파일명 결정"""
+        if self.font_name_option_group.checkedId() == 1:  # 사용자 정의 이름
+            # 사용자 정의 이름을 고른 경우 폰트 파일은 읽지 않음
+            name = self.font_name_input.text().strip()
+        else:
+            # 기본 폰트 이름 사용
+            name = self._extract_font_name(base_font_path)
+
+        if not name:
+            return f"merged_font{file_extension}"
+
+        # 파일명에 사용할 수 없는 문자 제거
+        return f"{self._sanitize_filename(name)}{file_extension}"
+
+    def _get_merger(self):
+        """재사용할 FontMerger 반환 (처음 호출 시 생성)"""
+        if self._merger is None:
+            self._merger = FontMerger()
+        return self._merger
+
+    def closeEvent(self, event):
+        """창을 닫기 전에 진행 중인 워커가 끝날 때까지 대기"""
+        self.left_font.stop_charset_worker()
+        self.right_font.stop_charset_worker()
         if hasattr(self, "worker") and self.worker.isRunning():
-            self.worker.terminate()
+            self.worker.cancel()
             self.worker.wait()
+        super().closeEvent(event)
+
+    def cancel_merge(self):
+        """
+        병합 작업 취소
+
+        워커는 다음 확인 지점에서 스스로 멈추며, GUI 스레드에서 기다리거나
+        강제 종료하지 않는다 (공유 병합기와 임시 파일이 중간 상태로 남지 않도록).
+        병합 버튼은 워커가 실제로 끝난 뒤에 다시 활성화된다.
+        """
+        if hasattr(self, "worker") and self.worker.isRunning():
+            self.worker.cancel()
+        else:
+            self._enable_merge_buttons()
+
+    def _enable_merge_buttons(self):
+        """병합 버튼 다시 활성화"""
         self.merge_ttf_button.setEnabled(True)
         self.merge_woff2_button.setEnabled(True)
 
@@ -372,14 +587,33 @@ class FontMergeApp(QMainWindow):
         """진행 상황 업데이트"""
         self.progress_dialog.setLabelText(message)
 
+    def on_merge_invalid(self, message):
+        """병합 전 유효성 검사 실패 처리"""
+        # 다이얼로그를 닫을 때도 canceled 시그널이 발생하므로 닫기 전에 확인
+        cancelled = self.worker.is_cancelled()
+        self.progress_dialog.close()
+
+        # 병합 버튼 다시 활성화
+        self._enable_merge_buttons()
+
+        # 취소된 작업의 늦은 결과는 알리지 않음
+        if cancelled:
+            return
+
+        QMessageBox.warning(self, "오류", message)
+
     def on_merge_finished(self, success, message):
         """병합 작업 완료 처리"""
-        # 대기 다이얼로그 닫기
+        # 대기 다이얼로그 닫기 (닫을 때도 canceled 시그널이 발생하므로 먼저 확인)
+        cancelled = self.worker.is_cancelled()
         self.progress_dialog.close()
 
         # 병합 버튼 다시 활성화
-        self.merge_ttf_button.setEnabled(True)
-        self.merge_woff2_button.setEnabled(True)
+        self._enable_merge_buttons()
+
+        # 취소된 작업의 늦은 결과는 알리지 않음
+        if cancelled:
+            return
 
         if success:
             QMessageBox.information(self, "완료", message)
@@ -399,132 +633,85 @@ class FontMergeApp(QMainWindow):
 
     def _get_merge_option_suggestion(self, current_option, error_message):
         """현재 옵션과 오류 메시지에 따라 적절한 제안 제공"""
-
-        # Units per em 관련 오류 감지
-        if "Expected all items to be equal" in error_message and "[" in error_message:
-            if current_option == 0:  # 기존 설정 사용
-                return (
-                    "💡 해결책: 두 폰트의 Units per em 값이 다릅니다.\n"
-                    "병합 옵션에서 'Units per em 통일'을 선택해보세요."
-                )
-            elif current_option == 1:  # UPM 통일
-                return (
-                    "💡 해결책: UPM 통일로도 해결되지 않았습니다.\n"
-                    "'관대한 병합 옵션'을 시도해보세요."
-                )
-
-        # 일반적인 호환성 문제
-        if "merge" in error_message.lower() or "table" in error_message.lower():
-            if current_option == 0:  # 기존 설정 사용
-                return (
-                    "💡 해결책: 폰트 호환성 문제가 발생했습니다.\n"
-                    "병합 옵션에서 'Units per em 통일' 또는 '관대한 병합 옵션'을 "
-                    "시도해보세요."
-                )
-            elif current_option == 1:  # UPM 통일
-                return (
-                    "💡 해결책: '관대한 병합 옵션'을 시도해보세요.\n"
-                    "이 옵션은 호환성 문제를 우회하여 강제로 병합합니다."
-                )
-
-        # 파일 경로 또는 권한 관련 오류
-        if "permission" in error_message.lower() or "access" in error_message.lower():
-            return (
-                "💡 해결책: 파일 접근 권한 문제입니다.\n"
-                "다른 위치에 저장하거나 파일이 사용 중이 아닌지 확인해보세요."
-            )
-
-        # 파일 형식 오류
-        if "format" in error_message.lower() or "invalid" in error_message.lower():
-            return (
-                "💡 해결책: 폰트 파일 형식에 문제가 있을 수 있습니다.\n"
-                "다른 폰트 파일을 시도하거나 파일이 손상되지 않았는지 확인해보세요."
-            )
+        # 메시지를 한 번만 훑어 해당하는 오류 분류 수집
+        categories = {
+            match.lastgroup for match in _MERGE_ERROR_RE.finditer(error_message.lower())
+        }
+
+        for category, messages in _MERGE_SUGGESTION_RULES:
+            if category not in categories:
+                continue
+            message = messages.get(current_option, messages.get(None))
+            if message:
+                return message
 
         # 기본 제안
-        if current_option == 0:
-            return (
-                "💡 해결책: 다른 병합 옵션을 시도해보세요:\n"
-                "• Units per em 통일: 폰트 크기 단위를 맞춤\n"
-                "• 관대한 병합 옵션: 호환성 문제를 우회하여 강제 병합"
-            )
-        elif current_option == 1:
-            return (
-                "💡 해결책: '관대한 병합 옵션'을 시도해보세요.\n"
-                "이 옵션은 더 강력한 호환성 처리를 제공합니다."
-            )
-        else:  # 관대한 옵션도 실패
-            return (
-                "💡 해결책: 모든 병합 옵션이 실패했습니다.\n"
-                "• 다른 폰트 파일을 시도해보세요\n"
-                "• 선택한 문자셋을 줄여보세요\n"
-                "• 폰트 파일이 손상되지 않았는지 확인해보세요"
-            )
+        return _DEFAULT_MERGE_SUGGESTIONS.get(
+            current_option, _DEFAULT_MERGE_SUGGESTIONS[None]
+        )
 
     def _sanitize_filename(self, filename):
         """파일명에 사용할 수 없는 문자를 제거"""
         # 파일명에 사용할 수 없는 문자들을 제거하거나 대체
-        illegal_chars = r'[<>:"/\\|?*]'
-        safe_filename = re.sub(illegal_chars, "_", filename)
+        safe_filename = filename.translate(_ILLEGAL_FILENAME_TABLE)
 
         # 연속된 공백을 하나로 줄이고 앞뒤 공백 제거
-        safe_filename = re.sub(r"\s+", " ", safe_filename.strip())
+        safe_filename = " ".join(safe_filename.split())
 
         # 최대 길이 제한 (확장자 제외하고 100자)
-        if len(safe_filename) > 100:
-            safe_filename = safe_filename[:100]
-
-        return safe_filename if safe_filename else "merged_font"
+        return safe_filename[:100] or "merged_font"
 
     def _extract_font_name(self, font_path):
         """폰트 파일에서 폰트 이름 추출"""
         try:
-            font = TTFont(font_path)
-
-            if "name" not in font:
-                return None
-
-            name_table = font["name"]
-
-            # 폰트 Family 이름 찾기 (nameID 1)
-            for record in name_table.names:
-                if record.nameID == 1:  # Font Family name
-                    # Windows Unicode 우선
-                    if record.platformID == 3 and record.platEncID == 1:
-                        return record.toUnicode()
-                    # Mac Roman도 시도
-                    elif record.platformID == 1 and record.platEncID == 0:
-                        return record.toUnicode()
-
-            # Full name도 시도 (nameID 4)
-            for record in name_table.names:
-                if record.nameID == 4:  # Full font name
-                    if record.platformID == 3 and record.platEncID == 1:
-                        return record.toUnicode()
-                    elif record.platformID == 1 and record.platEncID == 0:
-                        return record.toUnicode()
-
-            return None
-
+            return read_font_name(font_path)
         except Exception:
             return None
 
     def check_upm_difference(self):
-        """두 폰트의 UPM 차이를 확인하고 경고 표시"""
+        """두 폰트의 UPM 차이 확인 요청 (UPM 읽기는 워커 스레드에서 수행)"""
+        paths = (self.left_font.get_font_path(), self.right_font.get_font_path())
+        keys = tuple(self._upm_check_key(path) for path in paths)
+
+        # 두 파일 모두 경로와 내용이 바뀌지 않았으면 다시 확인할 필요 없음
+        if keys == self._last_upm_keys:
+            return
+
+        self._upm_generation += 1
+
+        # 두 폰트가 모두 선택되었는지 확인
+        if (
+            not self.left_font.has_font_selected()
+            or not self.right_font.has_font_selected()
+        ):
+            self._last_upm_keys = None
+            self.upm_warning_label.setVisible(False)
+            return
+
+        self._last_upm_keys = keys
+        worker = UpmCheckWorker(self._upm_generation, *paths, self)
+        worker.checked.connect(self._on_upm_checked, Qt.ConnectionType.QueuedConnection)
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+
+    def _upm_check_key(self, font_path):
+        """UPM 확인 결과 재사용 판단용 키 (경로, 수정 시각, 크기), 읽을 수 없으면 None"""
+        if not font_path:
+            return None
         try:
-            # 두 폰트가 모두 선택되었는지 확인
-            if (
-                not self.left_font.has_font_selected()
-                or not self.right_font.has_font_selected()
-            ):
-                self.upm_warning_label.setVisible(False)
-                return
+            return _font_cache_key(font_path)
+        except OSError:
+            return None
 
-            # 두 폰트의 UPM 값 추출
-            left_upm = self._get_font_upm(self.left_font.get_font_path())
-            right_upm = self._get_font_upm(self.right_font.get_font_path())
+    def _on_upm_checked(self, generation, left_upm, right_upm):
+        """UPM 값을 받아 경고 표시"""
+        # 그 사이 폰트가 다시 변경되었다면 결과 무시
+        if generation != self._upm_generation:
+            return
 
+        try:
             if left_upm is None or right_upm is None:
+                self._last_upm_keys = None
                 self.upm_warning_label.setVisible(False)
                 return
 
@@ -545,28 +732,17 @@ class FontMergeApp(QMainWindow):
                 self.upm_warning_label.setVisible(False)
 
         except Exception:
+            self._last_upm_keys = None
             self.upm_warning_label.setVisible(False)
 
-    def _get_font_upm(self, font_path):
-        """폰트 파일에서 UPM 값 추출"""
-        try:
-            font = TTFont(font_path)
-            if "head" in font:
-                return font["head"].unitsPerEm
-            return None
-        except Exception:
-            return None
-
 
 def main():
     app = QApplication(sys.argv)
 
     # 애플리케이션 아이콘 설정
-    icon_path = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), "..", "..", "icon.png"
-    )
-    if os.path.exists(icon_path):
-        app.setWindowIcon(QIcon(icon_path))
+    icon = _get_app_icon()
+    if icon is not None:
+        app.setWindowIcon(icon)
 
     window = FontMergeApp()
     window.show()